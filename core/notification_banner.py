@@ -6,6 +6,25 @@ Header with system status and alert banners.
 import pygame
 from datetime import datetime
 from core.design_tokens import *
+from core.text_cache import cached_render, get_font
+
+# Alert background and icon by type; any other type is shown as info
+ALERT_COLORS = {"severe": ALERT_RED, "medical": ALERT_AMBER}
+ALERT_INFO_COLOR = (59, 130, 246)  # Blue for info
+ALERT_ICONS = {"severe": "⚠", "medical": "🏥"}
+ALERT_INFO_ICON = "ℹ️"
+
+# Header state text color; any other state is shown as critical
+STATE_COLORS = {"CALM": STATE_CALM, "ALERT": STATE_ALERT}
+
+
+def ms_to_next_minute():
+    """Milliseconds until the wall clock reaches the next whole minute."""
+    now = datetime.now()
+    ms = (60 - now.second) * 1000 - now.microsecond // 1000
+    # set_timer() treats 0 as "disable the timer"
+    return max(1, ms)
+
 
 class NotificationBanner:
     def __init__(self, screen_width):
@@ -13,12 +32,29 @@ class NotificationBanner:
         self.current_state = "CALM"
         self.alerts = []  # List of active alerts
 
+        # Fonts, opened once rather than on every draw
+        self.font_alert_icon = get_font(FONT_ALERT_TITLE_SIZE + 4)
+        self.font_alert_title = get_font(FONT_ALERT_TITLE_SIZE)
+        self.font_alert_body = get_font(FONT_ALERT_BODY_SIZE)
+        self.font_header = get_font(FONT_HEADER_SIZE)
+        self.font_meta = get_font(FONT_HEADER_META_SIZE)
+        self.font_subtitle = get_font(FONT_HEADER_META_SIZE - 4)
+
+        # Header clock surfaces, re-rendered only when the minute or state changes
+        self._meta_key = None
+        self._meta_surface = None
+        self._state_surface = None
+        self._meta_x = 0
+        self._state_x = 0
+
     def add_alert(self, alert_type, title, description):
         """Add a new alert to the banner."""
         self.alerts.append({
             "type": alert_type,  # "severe", "medical", "info"
             "title": title,
-            "description": description
+            "description": description,
+            "bg_color": ALERT_COLORS.get(alert_type, ALERT_INFO_COLOR),
+            "icon": ALERT_ICONS.get(alert_type, ALERT_INFO_ICON),
         })
 
     def clear_alerts(self):
@@ -46,36 +82,29 @@ class NotificationBanner:
         """Draw a single alert banner."""
         alert_height = 70
 
-        # Determine alert color
-        if alert["type"] == "severe":
-            bg_color = ALERT_RED
-        elif alert["type"] == "medical":
-            bg_color = ALERT_AMBER
-        else:
-            bg_color = (59, 130, 246)  # Blue for info
-
         # Draw alert background (solid, no transparency)
         alert_rect = pygame.Rect(0, y_offset, self.screen_width, alert_height)
-        pygame.draw.rect(surface, bg_color, alert_rect)
+        pygame.draw.rect(surface, alert["bg_color"], alert_rect)
+
+        # Text blits are collected and submitted in one call
+        blit_list = []
 
         # Alert icon
         try:
-            icon_font = pygame.font.Font(None, FONT_ALERT_TITLE_SIZE + 4)
-            icon_text = "⚠" if alert["type"] == "severe" else "🏥" if alert["type"] == "medical" else "ℹ️"
-            icon_surface = icon_font.render(icon_text, True, ALERT_TEXT)
-            surface.blit(icon_surface, (PADDING, y_offset + 10))
+            icon_surface = cached_render(self.font_alert_icon, alert["icon"], ALERT_TEXT)
+            blit_list.append((icon_surface, (PADDING, y_offset + 10)))
         except:
             pass
 
         # Title
-        font_title = pygame.font.Font(None, FONT_ALERT_TITLE_SIZE)
-        title_surface = font_title.render(alert["title"], True, ALERT_TEXT)
-        surface.blit(title_surface, (PADDING + 40, y_offset + 10))
+        title_surface = cached_render(self.font_alert_title, alert["title"], ALERT_TEXT)
+        blit_list.append((title_surface, (PADDING + 40, y_offset + 10)))
 
         # Description
-        font_body = pygame.font.Font(None, FONT_ALERT_BODY_SIZE)
-        desc_surface = font_body.render(alert["description"], True, ALERT_TEXT)
-        surface.blit(desc_surface, (PADDING + 40, y_offset + 38))
+        desc_surface = cached_render(self.font_alert_body, alert["description"], ALERT_TEXT)
+        blit_list.append((desc_surface, (PADDING + 40, y_offset + 38)))
+
+        surface.blits(blit_list, doreturn=0)
 
         return alert_height
 
@@ -86,39 +115,38 @@ class NotificationBanner:
         pygame.draw.rect(surface, BG_HEADER, header_rect)
 
         # Left: System title
-        font_header = pygame.font.Font(None, FONT_HEADER_SIZE)
-        title_surface = font_header.render("MOTIBEAM SPATIAL OS", True, TEXT_PRIMARY)
-        surface.blit(title_surface, (PADDING, y_offset + 15))
+        title_surface = cached_render(self.font_header, "MOTIBEAM SPATIAL OS", TEXT_PRIMARY)
 
         # Right: Time, date, temp, state
-        font_meta = pygame.font.Font(None, FONT_HEADER_META_SIZE)
-
         now = datetime.now()
+        meta_key = (now.hour, now.minute, self.current_state)
+        if meta_key != self._meta_key:
+            self._render_meta(now)
+            self._meta_key = meta_key
+
+        # Subtitle
+        subtitle_surface = cached_render(self.font_subtitle, "Projection Operating System v1.0", TEXT_MUTED)
+
+        surface.blits((
+            (title_surface, (PADDING, y_offset + 15)),
+            (self._meta_surface, (self._meta_x, y_offset + 18)),
+            (self._state_surface, (self._state_x, y_offset + 18)),
+            (subtitle_surface, (PADDING, y_offset + 48)),
+        ), doreturn=0)
+
+    def _render_meta(self, now):
+        """Render the time/date/state text for the header."""
         time_str = now.strftime("%I:%M %p").lstrip('0')
         date_str = now.strftime("%a, %b %d")
         temp_str = "72°F"  # Mock temperature
 
-        # State color
-        if self.current_state == "CALM":
-            state_color = STATE_CALM
-        elif self.current_state == "ALERT":
-            state_color = STATE_ALERT
-        else:
-            state_color = STATE_CRITICAL
+        state_color = STATE_COLORS.get(self.current_state, STATE_CRITICAL)
 
         meta_text = f"{time_str} • {date_str} • {temp_str} • STATE: "
-        meta_surface = font_meta.render(meta_text, True, TEXT_SECONDARY)
-
-        state_surface = font_meta.render(self.current_state, True, state_color)
+        self._meta_surface = self.font_meta.render(meta_text, True, TEXT_SECONDARY).convert_alpha()
+        self._state_surface = cached_render(self.font_meta, self.current_state, state_color)
 
         # Right align
-        meta_width = meta_surface.get_width() + state_surface.get_width()
-        meta_x = self.screen_width - meta_width - PADDING
-
-        surface.blit(meta_surface, (meta_x, y_offset + 18))
-        surface.blit(state_surface, (meta_x + meta_surface.get_width(), y_offset + 18))
-
-        # Subtitle
-        font_subtitle = pygame.font.Font(None, FONT_HEADER_META_SIZE - 4)
-        subtitle_surface = font_subtitle.render("Projection Operating System v1.0", True, TEXT_MUTED)
-        surface.blit(subtitle_surface, (PADDING, y_offset + 48))
+        meta_width = self._meta_surface.get_width() + self._state_surface.get_width()
+        self._meta_x = self.screen_width - meta_width - PADDING
+        self._state_x = self._meta_x + self._meta_surface.get_width()
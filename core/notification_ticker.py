@@ -6,26 +6,53 @@ Footer with scrolling notifications and keyboard shortcuts.
 import pygame
 import time
 from core.design_tokens import *
+from core.text_cache import cached_render, get_font
 
 class NotificationTicker:
     def __init__(self, screen_width, screen_height):
         self.screen_width = screen_width
         self.screen_height = screen_height
         self.messages = []
+        self.message_texts = []  # messages with their bullet, formatted once
         self.current_message_index = 0
         self.scroll_x = 0
         self.last_message_change = time.time()
 
+        # Footer strip; the only area that animates between input events
+        self.rect = pygame.Rect(0, screen_height - TICKER_HEIGHT, screen_width, TICKER_HEIGHT)
+
+        # Fonts, opened once rather than on every draw
+        self.font_ticker = get_font(FONT_TICKER_SIZE)
+        self.font_hints = get_font(FONT_FOOTER_HINT_SIZE)
+
+        # Keyboard shortcuts never change: render and center them once
+        shortcuts_text = "Arrow Keys: Navigate  •  Enter: Select  •  1-9: Realm Quick-Select  •  A: Alert  •  M: Medical  •  C: Calm  •  Q: Quit"
+        self.hints_surface = cached_render(self.font_hints, shortcuts_text, TEXT_MUTED)
+        self.hints_dest = (
+            (screen_width - self.hints_surface.get_width()) // 2,
+            self.rect.y + TICKER_HEIGHT - 28,
+        )
+
+        # Surface and width of the message being scrolled, looked up only
+        # when the ticker moves on to another message
+        self.ticker_y = self.rect.y + 10
+        self._ticker_index = None
+        self._ticker_surface = None
+        self._ticker_width = 0
+
     def add_message(self, message):
         """Add a message to the ticker."""
         if message not in self.messages:
             self.messages.append(message)
+            self.message_texts.append(f"• {message}")
 
     def clear_messages(self):
         """Clear all ticker messages."""
         self.messages = []
+        self.message_texts = []
         self.current_message_index = 0
         self.scroll_x = 0
+        self._ticker_index = None
 
     def update(self):
         """Update ticker animation."""
@@ -43,33 +70,24 @@ class NotificationTicker:
 
     def draw(self, surface):
         """Draw the footer ticker and shortcuts."""
-        footer_y = self.screen_height - TICKER_HEIGHT
-
         # Background
-        footer_rect = pygame.Rect(0, footer_y, self.screen_width, TICKER_HEIGHT)
-        pygame.draw.rect(surface, BG_FOOTER, footer_rect)
+        pygame.draw.rect(surface, BG_FOOTER, self.rect)
 
         # Ticker messages (scrolling)
-        if len(self.messages) > 0:
-            font_ticker = pygame.font.Font(None, FONT_TICKER_SIZE)
-            current_message = self.messages[self.current_message_index]
-
-            # Add bullet point
-            message_text = f"• {current_message}"
-            ticker_surface = font_ticker.render(message_text, True, TEXT_PRIMARY)
+        if self.message_texts:
+            index = self.current_message_index
+            if index != self._ticker_index:
+                message_text = self.message_texts[index]
+                self._ticker_surface = cached_render(self.font_ticker, message_text, TEXT_PRIMARY)
+                self._ticker_width = self._ticker_surface.get_width()
+                self._ticker_index = index
 
             # Scroll from right to left
-            surface.blit(ticker_surface, (int(self.scroll_x), footer_y + 10))
+            surface.blit(self._ticker_surface, (int(self.scroll_x), self.ticker_y))
 
             # Reset scroll when message goes off screen
-            if self.scroll_x + ticker_surface.get_width() < 0:
+            if self.scroll_x + self._ticker_width < 0:
                 self.scroll_x = self.screen_width
 
         # Keyboard shortcuts (bottom line, centered)
-        font_hints = pygame.font.Font(None, FONT_FOOTER_HINT_SIZE)
-        shortcuts_text = "Arrow Keys: Navigate  •  Enter: Select  •  1-9: Realm Quick-Select  •  A: Alert  •  M: Medical  •  C: Calm  •  Q: Quit"
-        hints_surface = font_hints.render(shortcuts_text, True, TEXT_MUTED)
-
-        # Center horizontally
-        hints_x = (self.screen_width - hints_surface.get_width()) // 2
-        surface.blit(hints_surface, (hints_x, footer_y + TICKER_HEIGHT - 28))
+        surface.blit(self.hints_surface, self.hints_dest)
@@ -0,0 +1,41 @@
+"""
+MotiBeam Spatial OS - Text Cache
+Fonts and rasterized text shared by every UI component.
+"""
+
+import pygame
+from functools import lru_cache
+
+
+@lru_cache(maxsize=64)
+def get_font(size):
+    """Return pygame's default font at this size, opened once and shared.
+
+    Components asking for the same size get the same Font object, which
+    also lets them share cached_render entries.
+    """
+    return pygame.font.Font(None, size)
+
+
+@lru_cache(maxsize=2048)
+def cached_render(font, text, color):
+    """Rasterize text once per (font, text, color) and reuse the Surface.
+
+    One cache serves the grid, banner and ticker, so strings repeated
+    across components are only rasterized once. The result is converted
+    to the display's pixel format so later blits take SDL's fast path
+    instead of converting on every frame; call it only after
+    pygame.display.set_mode().
+    """
+    return font.render(text, True, color).convert_alpha()
+
+
+def clear():
+    """Drop every cached Font and Surface.
+
+    Both caches outlive pygame.quit(); call this when tearing pygame down
+    so a later re-init doesn't get fonts from the dead font module or
+    surfaces converted for a display that no longer exists.
+    """
+    cached_render.cache_clear()
+    get_font.cache_clear()
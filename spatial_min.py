@@ -1,20 +1,17 @@
-import os
 import pygame
 
 WIDTH, HEIGHT = 1024, 768
 
 def init_display():
     print("Initializing pygame (minimal)...")
-    pygame.quit()
-    pygame.display.quit()
-    pygame.init()
-
-    try:
-        os.unsetenv("SDL_VIDEODRIVER")
-    except Exception:
-        os.putenv("SDL_VIDEODRIVER", "")
-
+    # Only bring up what we use and let SDL pick the video driver itself
     pygame.display.init()
+    pygame.font.init()
+
+    # Plain software surface at the projector's native size, like the
+    # other shells. No SCALED/DOUBLEBUF/vsync: the scene is flipped once
+    # and again only on expose, so there are no frames to pace or tear,
+    # and SCALED would push each flip through SDL's renderer for nothing
     screen = pygame.display.set_mode((WIDTH, HEIGHT), pygame.FULLSCREEN)
     pygame.display.set_caption("MOTIBEAM MINIMAL")
     print("  ✓ Minimal display created")
@@ -22,28 +19,35 @@ def init_display():
 
 def main():
     screen = init_display()
-    clock = pygame.time.Clock()
 
-    font = pygame.font.SysFont(None, 72)
+    # Default font directly; SysFont(None, ...) scans system fonts first
+    font = pygame.font.Font(None, 72)
+
+    # The scene is static: compose it once, then sleep until input arrives
+    scene = pygame.Surface(screen.get_size()).convert()
+
+    # dark background
+    scene.fill((10, 10, 20))
+
+    # one bright card
+    pygame.draw.rect(scene, (40, 160, 255), (262, 184, 500, 300), border_radius=30)
+    text = font.render("MOTIBEAM", True, (255, 255, 255))
+    scene.blit(text, (WIDTH // 2 - text.get_width() // 2, HEIGHT // 2 - text.get_height() // 2))
+
+    screen.blit(scene, (0, 0))
+    pygame.display.flip()
 
     running = True
     while running:
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                running = False
-            if event.type == pygame.KEYDOWN and event.key == pygame.K_q:
-                running = False
-
-        # dark background
-        screen.fill((10, 10, 20))
-
-        # one bright card
-        pygame.draw.rect(screen, (40, 160, 255), (262, 184, 500, 300), border_radius=30)
-        text = font.render("MOTIBEAM", True, (255, 255, 255))
-        screen.blit(text, (WIDTH // 2 - text.get_width() // 2, HEIGHT // 2 - text.get_height() // 2))
-
-        pygame.display.flip()
-        clock.tick(30)
+        event = pygame.event.wait()
+        if event.type == pygame.QUIT:
+            running = False
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_q:
+            running = False
+        if event.type in (pygame.WINDOWEXPOSED, pygame.VIDEOEXPOSE):
+            # Output came back (window uncovered, VT switch): repaint
+            screen.blit(scene, (0, 0))
+            pygame.display.flip()
 
     pygame.quit()
 
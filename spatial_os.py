@@ -14,6 +14,7 @@ MotiBeam Spatial OS - Clean Pygame Launcher (Framebuffer-Friendly)
 import os
 import sys
 import pygame
+import pygame.freetype
 from datetime import datetime
 
 # ---------------------------
@@ -34,6 +35,19 @@ FOOTER_COLOR = (200, 205, 215)
 TEXT_PRIMARY = (245, 248, 255)
 TEXT_SECONDARY = (170, 175, 190)
 
+# Per-keypress logging; set MOTIBEAM_DEBUG=1 to see it on the console
+DEBUG = bool(os.getenv("MOTIBEAM_DEBUG"))
+
+# Posted by pygame.time.set_timer when the wall clock reaches a new minute
+MINUTE_EVENT = pygame.USEREVENT + 1
+
+# The window (or VT/KMS output) came back and its contents must be redrawn
+EXPOSE_EVENTS = frozenset((pygame.WINDOWEXPOSED, pygame.VIDEOEXPOSE))
+
+# Key groups checked on every keypress
+QUIT_KEYS = frozenset((pygame.K_q, pygame.K_ESCAPE))
+SELECT_KEYS = frozenset((pygame.K_RETURN, pygame.K_KP_ENTER))
+
 REALMS = [
     {"name": "CircleBeam", "subtitle": "Living relationships", "emoji": "👥"},
     {"name": "LegacyBeam", "subtitle": "Memory & legacy",      "emoji": "📖"},
@@ -49,6 +63,61 @@ REALMS = [
     {"name": "Maritime",   "subtitle": "Navigation",           "emoji": "⚓"},
 ]
 
+# Parallel (structure-of-arrays) views of REALMS for the draw/input paths
+REALM_NAMES = tuple(r["name"] for r in REALMS)
+REALM_SUBTITLES = tuple(r["subtitle"] for r in REALMS)
+REALM_EMOJIS = tuple(r["emoji"] for r in REALMS)
+
+# Color emoji fonts, in order of preference
+EMOJI_FONT_PATHS = (
+    "/usr/share/fonts/truetype/noto/NotoColorEmoji.ttf",
+    "/usr/share/fonts/noto/NotoColorEmoji.ttf",
+    "/System/Library/Fonts/Apple Color Emoji.ttc",
+)
+
+# Tallest emoji that still leaves room for the title and subtitle on a
+# card. NotoColorEmoji is a bitmap font with a single ~128px strike, so
+# its glyphs get scaled down to this; pygame's default font at 96 fits.
+EMOJI_MAX_HEIGHT = 66
+
+# Emoji fonts already opened by load_emoji_font, keyed by size
+_EMOJI_FONTS = {}
+
+
+# ---------------------------
+# Helpers
+# ---------------------------
+
+def ms_to_next_minute():
+    """Milliseconds until the wall clock reaches the next whole minute."""
+    now = datetime.now()
+    ms = (60 - now.second) * 1000 - now.microsecond // 1000
+    # set_timer() treats 0 as "disable the timer"
+    return max(1, ms)
+
+
+def load_emoji_font(size):
+    """Load the first installed color emoji font, else pygame's default.
+
+    Fonts are cached per size, so repeat calls don't re-probe the paths
+    or reopen the TTF.
+    """
+    font = _EMOJI_FONTS.get(size)
+    if font is not None:
+        return font
+    for path in EMOJI_FONT_PATHS:
+        if not os.path.isfile(path):
+            continue
+        try:
+            font = pygame.font.Font(path, size)
+            break
+        except (pygame.error, OSError) as e:
+            print(f"  ✗ Emoji font {path} failed: {e}")
+    else:
+        font = pygame.font.Font(None, size)
+    _EMOJI_FONTS[size] = font
+    return font
+
 
 # ---------------------------
 # Display init (matching test_display.py style)
@@ -61,81 +130,34 @@ def init_display(width, height):
     """
 
     print("Initializing pygame...")
-    pygame.quit()
-    pygame.display.quit()
-    pygame.init()
-
-    # Force SDL to pick the best driver automatically
-    try:
-        os.unsetenv("SDL_VIDEODRIVER")
-    except Exception:
-        os.putenv("SDL_VIDEODRIVER", "")
-
-    pygame.display.init()
-    screen = pygame.display.set_mode((width, height), pygame.FULLSCREEN)
-    print(f"  ✓ Display created successfully ({width}x{height}, fullscreen)")
-    pygame.display.set_caption("MotiBeam Spatial OS – Clean Build")
+    # Keep the projector from blanking mid-demo
+    os.environ.setdefault("SDL_VIDEO_ALLOW_SCREENSAVER", "0")
+    # Double- rather than triple-buffer on the KMSDRM/Pi backends: one
+    # frame less between a keypress and the projector
+    os.environ.setdefault("SDL_VIDEO_DOUBLE_BUFFER", "1")
 
-    return screen
+    # Nothing to tear down on a cold start
+    if pygame.display.get_init():
+        pygame.display.quit()
 
-    # Start fresh
-    pygame.quit()
-    pygame.display.quit()
-    pygame.init()
-
-    screen = None
-
-    if not os.getenv("DISPLAY"):
-        print("Console mode detected – trying framebuffer drivers...")
-        drivers = ["fbcon", "directfb", "svgalib"]
-        for driver in drivers:
-            print(f"  Trying video driver: {driver}...")
-            os.putenv("SDL_VIDEODRIVER", driver)
-            try:
-                pygame.display.init()
-                screen = pygame.display.set_mode((width, height), pygame.FULLSCREEN)
-                print(f"    ✓ Using driver: {driver}")
-                break
-            except pygame.error as e:
-                print(f"    ✗ {driver} failed: {e}")
-                pygame.display.quit()
-                screen = None
-
-        if screen is None:
-            # This is the path that worked in test_display.py:
-            # "Trying automatic driver selection... ✓"
-            print("  Trying automatic driver selection...")
-            # Clear SDL_VIDEODRIVER so SDL chooses
-            try:
-                os.unsetenv("SDL_VIDEODRIVER")
-            except Exception:
-                os.putenv("SDL_VIDEODRIVER", "")
-            pygame.display.init()
-            screen = pygame.display.set_mode((width, height), pygame.FULLSCREEN)
-            print("  ✓ Auto driver worked")
-    else:
-        # X11 / desktop
-        print(f"DISPLAY is set ({os.getenv('DISPLAY')}), using normal X11 init")
-        pygame.display.init()
-        screen = pygame.display.set_mode((width, height), pygame.FULLSCREEN)
-        print("  ✓ X11 display created")
+    # Fonts opened before an earlier pygame.quit() are dead; reopen them
+    _EMOJI_FONTS.clear()
 
-    pygame.display.set_caption("MotiBeam Spatial OS")
-    return screen
-
-    # Now create the display
-    flags = pygame.FULLSCREEN
-    print(f"Creating display: {width}x{height} (fullscreen=True)")
+    # Only bring up the subsystems this launcher actually uses; SDL picks
+    # the video driver itself unless SDL_VIDEODRIVER is set explicitly
+    pygame.display.init()
+    pygame.font.init()
+    pygame.freetype.init()
     try:
-        screen = pygame.display.set_mode((width, height), flags)
-        print("  ✓ Display created successfully")
+        screen = pygame.display.set_mode((width, height), pygame.FULLSCREEN)
+        print(f"  ✓ Display created successfully ({width}x{height}, fullscreen)")
     except pygame.error as e:
         print(f"  ✗ Fullscreen failed: {e}")
         print("  → Falling back to windowed mode")
         screen = pygame.display.set_mode((width, height))
         print("  ✓ Windowed display created successfully")
+    pygame.display.set_caption("MotiBeam Spatial OS – Clean Build")
 
-    pygame.display.set_caption("MotiBeam Spatial OS")
     return screen
 
 
@@ -145,17 +167,38 @@ class MotiBeamOS:
         self.width = width
         self.height = height
 
-        # Fonts (projection friendly – large)
-        self.font_header = pygame.font.SysFont(None, 42)
-        self.font_header_meta = pygame.font.SysFont(None, 30)
-        self.font_emoji = pygame.font.SysFont(None, 96)  # Increased from 64 to 96px for better visibility
-        self.font_card_title = pygame.font.SysFont(None, 34)
-        self.font_card_subtitle = pygame.font.SysFont(None, 22)
-        self.font_footer = pygame.font.SysFont(None, 24)
+        # Only QUIT, KEYDOWN, the clock tick and expose events are handled;
+        # have SDL drop everything else (mouse motion, text input, joystick
+        # axes...) before it reaches Python
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(
+            [pygame.QUIT, pygame.KEYDOWN, MINUTE_EVENT] + list(EXPOSE_EVENTS)
+        )
+
+        # Fonts (projection friendly – large). SysFont(None, ...) ends up on
+        # pygame's default font anyway, but the first SysFont call scans
+        # every system font (pygame caches the table after that); build the
+        # default-font objects directly and skip that one scan.
+        self.font_header = pygame.font.Font(None, 42)
+        # The clock is the only text drawn after startup: freetype renders it
+        # straight onto the screen and keeps its digit glyphs cached. (pygame.font
+        # shrinks its default font to 0.6875x; match the old 30px size.)
+        self.font_header_meta = pygame.freetype.Font(None, 30 * 0.6875)
+        self.font_header_meta.origin = True
+        self.font_card_title = pygame.font.Font(None, 34)
+        self.font_card_subtitle = pygame.font.Font(None, 22)
+        self.font_footer = pygame.font.Font(None, 24)
 
-        self.clock = pygame.time.Clock()
         self.selected_index = 0  # which card is selected
 
+        # Redraw only when something visible changed: _dirty forces a full
+        # repaint, dirty_rects collects the areas touched since last update
+        self._dirty = True
+        self.dirty_rects = []
+        # Card currently painted as selected; input only touches
+        # selected_index and render() catches the screen up afterwards
+        self._shown_index = self.selected_index
+
         # Precompute grid cell sizes
         self.grid_top = 140
         self.grid_bottom = self.height - 120
@@ -165,144 +208,285 @@ class MotiBeamOS:
         self.cell_w = available_width // GRID_COLS
         self.cell_h = available_height // GRID_ROWS
 
-    def draw_header(self):
-        # Left: title
-        title_text = self.font_header.render("MOTIBEAM SPATIAL OS", True, HEADER_COLOR)
-        self.screen.blit(title_text, (40, 30))
+        # Every arrow move resolved up front: (index, dx, dy) -> new index
+        self.transitions = {}
+        for index in range(len(REALMS)):
+            row, col = divmod(index, GRID_COLS)
+            for dx, dy in ((-1, 0), (1, 0), (0, -1), (0, 1)):
+                new_row = max(0, min(GRID_ROWS - 1, row + dy))
+                new_col = max(0, min(GRID_COLS - 1, col + dx))
+                new_index = new_row * GRID_COLS + new_col
+                if new_index >= len(REALMS):
+                    new_index = index
+                self.transitions[(index, dx, dy)] = new_index
+
+        # Key dispatch tables: arrows -> (dx, dy), number keys 1–9 -> card
+        self.nav_handlers = {
+            pygame.K_LEFT: (-1, 0),
+            pygame.K_RIGHT: (1, 0),
+            pygame.K_UP: (0, -1),
+            pygame.K_DOWN: (0, 1),
+        }
+        self.quick_jump = {pygame.K_1 + i: i for i in range(min(9, len(REALMS)))}
+
+        # Header strip repainted when the clock minute rolls over
+        self.header_rect = pygame.Rect(0, 0, self.width, self.grid_top)
+
+        # Top-left corner of every card; the layout never changes
+        self.card_positions = tuple(
+            (
+                60 + (i % GRID_COLS) * self.cell_w + 10,
+                self.grid_top + (i // GRID_COLS) * self.cell_h + 10,
+            )
+            for i in range(len(REALMS))
+        )
+        # Plain tuples: blit/draw/display.update all accept them directly
+        self.card_rects = tuple(
+            (x, y, self.cell_w - 20, self.cell_h - 20)
+            for x, y in self.card_positions
+        )
 
-        # Right: time + date
-        now = datetime.now()
-        time_str = now.strftime("%I:%M %p").lstrip("0")
-        date_str = now.strftime("%a • %b %d")
+        # Time/date strings are re-formatted only on MINUTE_EVENT
+        self._time_str = ""
+        self._date_str = ""
+        self._time_x = 0
+        self.update_clock()
+        meta_ascender = self.font_header_meta.get_sized_ascender()
+        self._time_y = 26 + meta_ascender
+        self._date_y = self._time_y + self.font_header_meta.get_sized_height() + 4
+
+        self.build_emoji_atlas()
+        self.build_card_cache()
+        self.build_static_bg()
+
+    def build_emoji_atlas(self):
+        """Rasterize the realm emoji once, packed side by side in one surface."""
+        # The 12 emoji are fixed: render them once here
+        font_emoji = load_emoji_font(96)  # Increased from 64 to 96px for better visibility
+        surfs = []
+        for emoji in REALM_EMOJIS:
+            surf = font_emoji.render(emoji, True, TEXT_PRIMARY)
+            w, h = surf.get_size()
+            if h > EMOJI_MAX_HEIGHT:
+                size = (max(1, w * EMOJI_MAX_HEIGHT // h), EMOJI_MAX_HEIGHT)
+                surf = pygame.transform.smoothscale(surf.convert_alpha(), size)
+            surfs.append(surf)
+
+        slot_w = max(surf.get_width() for surf in surfs)
+        slot_h = max(surf.get_height() for surf in surfs)
+        atlas = pygame.Surface((slot_w * len(surfs), slot_h), pygame.SRCALPHA)
+
+        src_rects = []
+        for i, surf in enumerate(surfs):
+            # MAX onto the fully transparent atlas copies pixels untouched
+            atlas.blit(surf, (i * slot_w, 0), special_flags=pygame.BLEND_RGBA_MAX)
+            src_rects.append(surf.get_rect(topleft=(i * slot_w, 0)))
+
+        self.emoji_atlas = atlas.convert_alpha()
+        self.emoji_src_rects = tuple(src_rects)
+
+    def build_card_cache(self):
+        """Pre-render every realm card in its normal and selected state."""
+        card_w = self.cell_w - 20
+        card_h = self.cell_h - 20
+        card_rect = (0, 0, card_w, card_h)
+        center_x = card_w // 2
+
+        # Rounded background + border drawn once per state; every card
+        # starts from a copy of its template
+        template_normal = pygame.Surface((card_w, card_h), pygame.SRCALPHA)
+        pygame.draw.rect(template_normal, CARD_BG, card_rect, border_radius=18)
+        pygame.draw.rect(
+            template_normal,
+            CARD_BORDER,
+            card_rect,
+            width=2,
+            border_radius=18,
+        )
+        template_selected = pygame.Surface((card_w, card_h), pygame.SRCALPHA)
+        pygame.draw.rect(template_selected, CARD_BG, card_rect, border_radius=18)
+        pygame.draw.rect(
+            template_selected,
+            CARD_BORDER_SELECTED,
+            card_rect,
+            width=4,
+            border_radius=18,
+        )
 
-        time_surf = self.font_header_meta.render(time_str, True, HEADER_COLOR)
-        date_surf = self.font_header_meta.render(date_str, True, HEADER_COLOR)
+        self.card_cache_normal = []
+        self.card_cache_selected = []
 
-        tx = self.width - time_surf.get_width() - 40
-        ty = 26
-        self.screen.blit(time_surf, (tx, ty))
-        self.screen.blit(date_surf, (tx, ty + time_surf.get_height() + 4))
+        for name, subtitle, emoji_src in zip(
+            REALM_NAMES, REALM_SUBTITLES, self.emoji_src_rects
+        ):
+            title_surf = self.font_card_title.render(name, True, TEXT_PRIMARY)
+            subtitle_surf = self.font_card_subtitle.render(
+                subtitle, True, TEXT_SECONDARY
+            )
+
+            # Emoji (larger 96px size)
+            ex = center_x - emoji_src.width // 2
+            ey = 12
+
+            # Title
+            tx = center_x - title_surf.get_width() // 2
+            ty = ey + emoji_src.height + 8
+
+            # Subtitle
+            sx = center_x - subtitle_surf.get_width() // 2
+            sy = ty + title_surf.get_height() + 4
+
+            # Same content on both states; each card gets it in one call
+            content = (
+                (self.emoji_atlas, (ex, ey), emoji_src),
+                (title_surf, (tx, ty)),
+                (subtitle_surf, (sx, sy)),
+            )
+
+            for template, cache in (
+                (template_normal, self.card_cache_normal),
+                (template_selected, self.card_cache_selected),
+            ):
+                card = template.copy()
+                card.blits(content, doreturn=0)
+
+                # Match the display format so blits skip per-pixel conversion
+                cache.append(card.convert_alpha())
+
+    def build_static_bg(self):
+        """Composite everything that never changes into one surface."""
+        bg = pygame.Surface((self.width, self.height)).convert()
+        bg.fill(BG_COLOR)
+
+        # Header title
+        title_surf = self.font_header.render("MOTIBEAM SPATIAL OS", True, HEADER_COLOR)
+        bg.blit(title_surf, (40, 30))
+
+        # Every card in its unselected state
+        bg.blits(list(zip(self.card_cache_normal, self.card_positions)), doreturn=0)
 
-    def draw_footer(self):
         # Simple footer strip
         footer_rect = pygame.Rect(0, self.height - 60, self.width, 60)
-        pygame.draw.rect(self.screen, (18, 20, 30), footer_rect)
+        pygame.draw.rect(bg, (18, 20, 30), footer_rect)
 
         footer_text = (
             "←↑↓→ Move   |   Enter Select   |   Q / ESC Exit   |   1–9 Quick Jump"
         )
         surf = self.font_footer.render(footer_text, True, FOOTER_COLOR)
-        self.screen.blit(
+        bg.blit(
             surf,
             (self.width // 2 - surf.get_width() // 2,
              self.height - 60 + 18),
         )
 
-    def draw_grid(self):
-        for i, realm in enumerate(REALMS):
-            row = i // GRID_COLS
-            col = i % GRID_COLS
-
-            x = 60 + col * self.cell_w
-            y = self.grid_top + row * self.cell_h
-
-            card_rect = pygame.Rect(
-                x + 10, y + 10, self.cell_w - 20, self.cell_h - 20
-            )
+        self.static_bg = bg
 
-            # Card background
-            pygame.draw.rect(self.screen, CARD_BG, card_rect, border_radius=18)
-
-            # Card border (selected or normal)
-            if i == self.selected_index:
-                pygame.draw.rect(
-                    self.screen,
-                    CARD_BORDER_SELECTED,
-                    card_rect,
-                    width=4,
-                    border_radius=18,
-                )
-            else:
-                pygame.draw.rect(
-                    self.screen,
-                    CARD_BORDER,
-                    card_rect,
-                    width=2,
-                    border_radius=18,
-                )
-
-            # Emoji (larger 96px size)
-            emoji_surf = self.font_emoji.render(realm["emoji"], True, TEXT_PRIMARY)
-            ex = card_rect.centerx - emoji_surf.get_width() // 2
-            ey = card_rect.y + 12  # Reduced from 18 to 12 for better vertical centering
-            self.screen.blit(emoji_surf, (ex, ey))
-
-            # Title
-            title_surf = self.font_card_title.render(
-                realm["name"], True, TEXT_PRIMARY
-            )
-            tx = card_rect.centerx - title_surf.get_width() // 2
-            ty = ey + emoji_surf.get_height() + 8  # Reduced from 10 to 8 for tighter spacing
-            self.screen.blit(title_surf, (tx, ty))
+    def update_clock(self):
+        """Re-format the header time/date strings from the wall clock."""
+        now = datetime.now()
+        self._time_str = now.strftime("%I:%M %p").lstrip("0")
+        self._date_str = now.strftime("%a • %b %d")
+        self._time_x = self.width - self.font_header_meta.get_rect(self._time_str).width - 40
 
-            # Subtitle
-            subtitle_surf = self.font_card_subtitle.render(
-                realm["subtitle"], True, TEXT_SECONDARY
-            )
-            sx = card_rect.centerx - subtitle_surf.get_width() // 2
-            sy = ty + title_surf.get_height() + 4
-            self.screen.blit(subtitle_surf, (sx, sy))
+    def draw_header(self):
+        # Right: time + date, baseline-anchored and rendered directly into
+        # the screen surface
+        font = self.font_header_meta
+        font.render_to(self.screen, (self._time_x, self._time_y), self._time_str, HEADER_COLOR)
+        font.render_to(self.screen, (self._time_x, self._date_y), self._date_str, HEADER_COLOR)
 
-    def move_selection(self, dx, dy):
+    def draw_grid(self):
+        # Unselected cards are already baked into static_bg
         index = self.selected_index
-        row = index // GRID_COLS
-        col = index % GRID_COLS
+        self.screen.blit(self.card_cache_selected[index], self.card_positions[index])
+
+    def redraw_header(self):
+        """Repaint the header strip in place and mark it dirty."""
+        self.screen.blit(self.static_bg, self.header_rect, self.header_rect)
+        self.draw_header()
+        self.dirty_rects.append(self.header_rect)
+
+    def redraw_card(self, index):
+        """Repaint a single card in place and mark its rect dirty."""
+        rect = self.card_rects[index]
+        self.screen.blit(self.static_bg, rect, rect)
+        if index == self._shown_index:
+            self.screen.blit(self.card_cache_selected[index], rect)
+        self.dirty_rects.append(rect)
+
+    def render(self):
+        """Bring the screen up to date with the current state and push it."""
+        if self._dirty:
+            self._shown_index = self.selected_index
+            self.screen.blit(self.static_bg, (0, 0))
+            self.draw_header()
+            self.draw_grid()
 
-        row = max(0, min(GRID_ROWS - 1, row + dy))
-        col = max(0, min(GRID_COLS - 1, col + dx))
+            pygame.display.flip()
+            self._dirty = False
+            self.dirty_rects.clear()
+            return
+
+        # However many moves were handled, only the previously shown and
+        # the newly selected card need repainting
+        if self.selected_index != self._shown_index:
+            old_index = self._shown_index
+            self._shown_index = self.selected_index
+            self.redraw_card(old_index)
+            self.redraw_card(self._shown_index)
+
+        if self.dirty_rects:
+            # Push one bounding rect: a single update region is cheaper
+            # for SDL than the old and new card as separate rects
+            first, *rest = self.dirty_rects
+            pygame.display.update(pygame.Rect(first).unionall(rest))
+            self.dirty_rects.clear()
 
-        new_index = row * GRID_COLS + col
-        if new_index < len(REALMS):
-            self.selected_index = new_index
+    def move_selection(self, dx, dy):
+        self.selected_index = self.transitions[(self.selected_index, dx, dy)]
 
     def handle_key(self, key):
-        if key in (pygame.K_q, pygame.K_ESCAPE):
+        if key in QUIT_KEYS:
             pygame.quit()
             sys.exit(0)
 
-        if key == pygame.K_LEFT:
-            self.move_selection(-1, 0)
-        elif key == pygame.K_RIGHT:
-            self.move_selection(1, 0)
-        elif key == pygame.K_UP:
-            self.move_selection(0, -1)
-        elif key == pygame.K_DOWN:
-            self.move_selection(0, 1)
-        elif key == pygame.K_RETURN or key == pygame.K_KP_ENTER:
-            realm = REALMS[self.selected_index]
-            print(f"[SELECT] {realm['name']} – {realm['subtitle']}")
-        elif pygame.K_1 <= key <= pygame.K_9:
-            idx = key - pygame.K_1
-            if idx < len(REALMS):
-                self.selected_index = idx
+        move = self.nav_handlers.get(key)
+        if move is not None:
+            self.move_selection(*move)
+        elif key in self.quick_jump:
+            self.selected_index = self.quick_jump[key]
+        elif key in SELECT_KEYS:
+            if DEBUG:
+                index = self.selected_index
+                print(f"[SELECT] {REALM_NAMES[index]} – {REALM_SUBTITLES[index]}")
 
     def run(self):
         print("MotiBeam Spatial OS – clean launcher running (framebuffer-friendly)")
+        # One-shot timer, re-armed on every tick so it stays on the minute
+        pygame.time.set_timer(MINUTE_EVENT, ms_to_next_minute(), 1)
         while True:
-            for event in pygame.event.get():
+            # Sleep until input arrives or the header clock needs to tick
+            events = [pygame.event.wait()]
+            # Drain anything else that queued up in the meantime
+            events.extend(pygame.event.get())
+
+            # Handle every queued event before drawing anything, so a burst
+            # of key repeats costs a single repaint
+            for event in events:
                 if event.type == pygame.QUIT:
                     pygame.quit()
                     sys.exit(0)
                 if event.type == pygame.KEYDOWN:
                     self.handle_key(event.key)
-
-            self.screen.fill(BG_COLOR)
-            self.draw_header()
-            self.draw_grid()
-            self.draw_footer()
-
-            pygame.display.flip()
-            self.clock.tick(30)
+                elif event.type in EXPOSE_EVENTS:
+                    self._dirty = True
+                elif event.type == MINUTE_EVENT:
+                    pygame.time.set_timer(MINUTE_EVENT, ms_to_next_minute(), 1)
+                    self.update_clock()
+                    if not self._dirty:
+                        self.redraw_header()
+
+            self.render()
 
 
 if __name__ == "__main__":
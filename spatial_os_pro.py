@@ -16,6 +16,10 @@ import os
 sys.path.insert(0, '/home/motibeam/motibeam-spatial-os')
 
 from core.ui.framework import Theme, UIComponents, Animations
+from core.text_cache import get_font, clear as clear_text_cache
+
+# Keys that leave the menu or a realm screen
+EXIT_KEYS = frozenset((pygame.K_ESCAPE, pygame.K_q))
 
 
 class SpatialOSPro:
@@ -39,6 +43,24 @@ class SpatialOSPro:
         self.theme = Theme()
         self.ui = UIComponents()
         
+        # Fonts, sized from the display; get_font shares one Font per size
+        # with anything else in the process that asks for the same size
+        self.font_huge = get_font(int(self.height * 0.12))
+        self.font_large = get_font(int(self.height * 0.08))
+        self.font_medium = get_font(int(self.height * 0.04))
+        self.font_header = get_font(int(self.height * 0.032))
+        self.font_item = get_font(int(self.height * 0.028))
+        self.font_small = get_font(int(self.height * 0.025))
+        
+        # Banner placement, centered once: the title only changes colour
+        # as it pulses, and the subtitle and tagline never change
+        self.title_rect = pygame.Rect((0, 0), self.font_huge.size("MOTIBEAM"))
+        self.title_rect.center = (self.width // 2, int(self.height * 0.12))
+        self.subtitle_surf = self.font_medium.render("SPATIAL OS PRO", True, self.theme.TEXT_SECONDARY).convert_alpha()
+        self.subtitle_rect = self.subtitle_surf.get_rect(center=(self.width // 2, int(self.height * 0.20)))
+        self.tagline_surf = self.font_small.render("Enterprise Spatial Computing Platform", True, self.theme.TEXT_DIM).convert_alpha()
+        self.tagline_rect = self.tagline_surf.get_rect(center=(self.width // 2, int(self.height * 0.25)))
+        
         # Realm configuration
         self.realms = {
             'home': {
@@ -91,8 +113,99 @@ class SpatialOSPro:
         self.realm_order = ['home', 'clinical', 'education', 'transport', 
                            'emergency', 'security', 'enterprise', 'aviation', 'maritime']
         
+        # Menu fields as parallel tuples in realm_order, so the per-frame
+        # menu draw indexes by position instead of going through the dicts
+        self.menu_labels = tuple(
+            f"[{self.realms[r]['num']}] {self.realms[r]['icon']}  {self.realms[r]['name']}"
+            for r in self.realm_order
+        )
+        self.menu_colors = tuple(self.realms[r]['color'] for r in self.realm_order)
+        
+        # Menu text never changes apart from the selected item's colour:
+        # rasterize headers and both label states once, in the display's
+        # pixel format
+        self.consumer_header_surf = self.font_header.render("CONSUMER REALMS", True, self.theme.INFO).convert_alpha()
+        self.ops_header_surf = self.font_header.render("OPERATIONS REALMS", True, self.theme.WARNING).convert_alpha()
+        self.label_surfs = tuple(
+            self.font_item.render(label, True, self.theme.TEXT_SECONDARY).convert_alpha()
+            for label in self.menu_labels
+        )
+        self.label_surfs_selected = tuple(
+            self.font_item.render(label, True, self.theme.TEXT_PRIMARY).convert_alpha()
+            for label in self.menu_labels
+        )
+        
         self.running = True
         self.selected_index = 0
+        
+        # Menu navigation resolved up front: (index, key) -> new index,
+        # plus number keys 1-9 -> realm position
+        realm_count = len(self.realm_order)
+        self.menu_transitions = {}
+        for index in range(realm_count):
+            self.menu_transitions[(index, pygame.K_UP)] = (index - 1) % realm_count
+            self.menu_transitions[(index, pygame.K_DOWN)] = (index + 1) % realm_count
+        self.quick_select = {pygame.K_1 + i: i for i in range(min(9, realm_count))}
+        
+        # Menu layout, fixed for the display size: computed once here
+        # instead of per item per frame
+        self.header_x = int(self.width * 0.1)
+        self.item_x = int(self.width * 0.12)
+        y_pos = int(self.height * 0.30)
+        self.consumer_header_y = y_pos
+        y_pos += int(self.height * 0.045)
+        item_ys = []
+        for _ in self.realm_order[:4]:
+            item_ys.append(y_pos)
+            y_pos += int(self.height * 0.052)
+        y_pos += int(self.height * 0.025)
+        self.ops_header_y = y_pos
+        y_pos += int(self.height * 0.045)
+        for _ in self.realm_order[4:]:
+            item_ys.append(y_pos)
+            y_pos += int(self.height * 0.052)
+        self.item_ys = tuple(item_ys)
+        
+        highlight_size = (int(self.width * 0.84), int(self.height * 0.048))
+        self.highlight_rects = tuple(
+            pygame.Rect((int(self.width * 0.08), y - 6), highlight_size)
+            for y in self.item_ys
+        )
+        
+        # Selection highlight per realm, built once; the pulse only changes its alpha
+        highlight_surfaces = []
+        for color in self.menu_colors:
+            highlight_surface = pygame.Surface(highlight_size).convert()
+            highlight_surface.fill(color)
+            highlight_surfaces.append(highlight_surface)
+        self.highlight_surfaces = tuple(highlight_surfaces)
+        
+        # Rounded selection border per realm colour, stroked once onto a
+        # transparent layer the size of one highlight
+        highlight_borders = []
+        for color in self.menu_colors:
+            border_surface = pygame.Surface(highlight_size, pygame.SRCALPHA)
+            pygame.draw.rect(border_surface, color, border_surface.get_rect(), 3, border_radius=10)
+            highlight_borders.append(border_surface.convert_alpha())
+        self.highlight_borders = tuple(highlight_borders)
+        
+        self.build_menu_background()
+    
+    def build_menu_background(self) -> None:
+        """Pre-bake the static menu chrome and unselected labels"""
+        # Chrome only: background, banner subtitle/tagline, section headers
+        chrome = pygame.Surface((self.width, self.height)).convert()
+        chrome.fill(self.theme.BACKGROUND)
+        chrome.blit(self.subtitle_surf, self.subtitle_rect)
+        chrome.blit(self.tagline_surf, self.tagline_rect)
+        chrome.blit(self.consumer_header_surf, (self.header_x, self.consumer_header_y))
+        chrome.blit(self.ops_header_surf, (self.header_x, self.ops_header_y))
+        self.menu_chrome = chrome
+        
+        # Full menu with every item unselected
+        self.menu_background = chrome.copy()
+        for label_surf, y in zip(self.label_surfs, self.item_ys):
+            self.menu_background.blit(label_surf, (self.item_x, y))
     
     def draw_banner(self, elapsed: float) -> None:
         """Draw animated banner"""
@@ -100,78 +213,35 @@ class SpatialOSPro:
         pulse = self.ui.pulse_value(elapsed, 0.5, 0.8, 1.0)
         glow_color = tuple(int(c * pulse) for c in self.theme.PRIMARY)
         
-        # Title
-        font_huge = pygame.font.Font(None, int(self.height * 0.12))
-        title = font_huge.render("MOTIBEAM", True, glow_color)
-        title_rect = title.get_rect(center=(self.width // 2, int(self.height * 0.12)))
-        self.screen.blit(title, title_rect)
-        
-        # Subtitle
-        font_medium = pygame.font.Font(None, int(self.height * 0.04))
-        subtitle = font_medium.render("SPATIAL OS PRO", True, self.theme.TEXT_SECONDARY)
-        subtitle_rect = subtitle.get_rect(center=(self.width // 2, int(self.height * 0.20)))
-        self.screen.blit(subtitle, subtitle_rect)
-        
-        # Tagline
-        font_small = pygame.font.Font(None, int(self.height * 0.025))
-        tagline = font_small.render("Enterprise Spatial Computing Platform", True, self.theme.TEXT_DIM)
-        tagline_rect = tagline.get_rect(center=(self.width // 2, int(self.height * 0.25)))
-        self.screen.blit(tagline, tagline_rect)
+        # Title (subtitle and tagline are baked into the menu background)
+        title = self.font_huge.render("MOTIBEAM", True, glow_color)
+        self.screen.blit(title, self.title_rect)
     
     def draw_realm_menu(self, elapsed: float) -> None:
-        """Draw professional realm selection menu"""
-        # Section headers
-        font_header = pygame.font.Font(None, int(self.height * 0.032))
-        font_item = pygame.font.Font(None, int(self.height * 0.028))
-        
-        y_pos = int(self.height * 0.30)
-        
-        # Consumer Realms
-        consumer_header = font_header.render("CONSUMER REALMS", True, self.theme.INFO)
-        self.screen.blit(consumer_header, (int(self.width * 0.1), y_pos))
-        y_pos += int(self.height * 0.045)
-        
-        for i, realm_id in enumerate(self.realm_order[:4]):
-            self.draw_realm_item(realm_id, i, y_pos, elapsed, font_item)
-            y_pos += int(self.height * 0.052)
-        
-        # Operations Realms
-        y_pos += int(self.height * 0.025)
-        ops_header = font_header.render("OPERATIONS REALMS", True, self.theme.WARNING)
-        self.screen.blit(ops_header, (int(self.width * 0.1), y_pos))
-        y_pos += int(self.height * 0.045)
+        """Draw the selected realm over the pre-baked menu"""
+        index = self.selected_index
+        highlight_rect = self.highlight_rects[index]
         
-        for i, realm_id in enumerate(self.realm_order[4:], start=4):
-            self.draw_realm_item(realm_id, i, y_pos, elapsed, font_item)
-            y_pos += int(self.height * 0.052)
-    
-    def draw_realm_item(self, realm_id: str, index: int, y_pos: int, 
-                       elapsed: float, font: pygame.font.Font) -> None:
-        """Draw individual realm menu item"""
-        realm = self.realms[realm_id]
-        is_selected = (index == self.selected_index)
+        # Clear the baked-in unselected label from under the highlight
+        self.screen.blit(self.menu_chrome, highlight_rect, highlight_rect)
         
         # Selection highlight
-        if is_selected:
-            pulse = self.ui.pulse_value(elapsed, 2.0, 0.3, 0.6)
-            highlight_rect = pygame.Rect(
-                int(self.width * 0.08), y_pos - 6,
-                int(self.width * 0.84), int(self.height * 0.048)
-            )
-            highlight_surface = pygame.Surface((highlight_rect.width, highlight_rect.height), pygame.SRCALPHA)
-            highlight_surface.fill((*realm['color'], int(255 * pulse)))
-            self.screen.blit(highlight_surface, highlight_rect)
-            pygame.draw.rect(self.screen, realm['color'], highlight_rect, 3, border_radius=10)
-        
-        # Realm text
-        text = f"[{realm['num']}] {realm['icon']}  {realm['name']}"
-        color = self.theme.TEXT_PRIMARY if is_selected else self.theme.TEXT_SECONDARY
-        text_surf = font.render(text, True, color)
-        self.screen.blit(text_surf, (int(self.width * 0.12), y_pos))
+        pulse = self.ui.pulse_value(elapsed, 2.0, 0.3, 0.6)
+        highlight_surface = self.highlight_surfaces[index]
+        highlight_surface.set_alpha(int(255 * pulse))
+        
+        # Highlight, border and realm text in one batched call
+        self.screen.blits((
+            (highlight_surface, highlight_rect),
+            (self.highlight_borders[index], highlight_rect),
+            (self.label_surfs_selected[index], (self.item_x, self.item_ys[index])),
+        ), doreturn=0)
     
     def show_menu(self) -> str:
         """Show main menu and return selected realm"""
         start_time = time.time()
+        # Highlight pushed to the display last frame; None forces a full flip
+        shown_rect = None
         
         while self.running:
             elapsed = time.time() - start_time
@@ -181,31 +251,43 @@ class SpatialOSPro:
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
                     return None
+                elif event.type in (pygame.WINDOWEXPOSED, pygame.VIDEOEXPOSE):
+                    # The compositor lost the window contents: repaint it all
+                    shown_rect = None
                 elif event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_ESCAPE or event.key == pygame.K_q:
+                    if event.key in EXIT_KEYS:
                         return None
-                    elif event.key == pygame.K_UP:
-                        self.selected_index = (self.selected_index - 1) % 9
-                    elif event.key == pygame.K_DOWN:
-                        self.selected_index = (self.selected_index + 1) % 9
+                    new_index = self.menu_transitions.get((self.selected_index, event.key))
+                    if new_index is not None:
+                        self.selected_index = new_index
                     elif event.key == pygame.K_RETURN:
                         return self.realm_order[self.selected_index]
-                    elif event.key in [pygame.K_1, pygame.K_2, pygame.K_3, pygame.K_4, 
-                                      pygame.K_5, pygame.K_6, pygame.K_7, pygame.K_8, pygame.K_9]:
-                        index = int(chr(event.key)) - 1
-                        return self.realm_order[index]
+                    elif event.key in self.quick_select:
+                        return self.realm_order[self.quick_select[event.key]]
             
-            # Render
-            self.screen.fill(self.theme.BACKGROUND)
+            # Render: only the pulsing title and highlight change between
+            # frames, so the background and footer are painted once
+            highlight_rect = self.highlight_rects[self.selected_index]
+            if shown_rect is None:
+                self.screen.blit(self.menu_background, (0, 0))
+                self.ui.draw_footer(self.screen, 
+                                   "↑↓ Navigate | 1-9 Quick Select | ENTER Launch | ESC/Q Exit",
+                                   self.theme.PRIMARY)
+            else:
+                self.screen.blit(self.menu_background, self.title_rect, self.title_rect)
+                if shown_rect is not highlight_rect:
+                    # Put the previous row back to its unselected state
+                    self.screen.blit(self.menu_background, shown_rect, shown_rect)
             self.draw_banner(elapsed)
             self.draw_realm_menu(elapsed)
             
-            # Footer
-            self.ui.draw_footer(self.screen, 
-                               "↑↓ Navigate | 1-9 Quick Select | ENTER Launch | ESC/Q Exit",
-                               self.theme.PRIMARY)
-            
-            pygame.display.flip()
+            if shown_rect is None:
+                pygame.display.flip()
+            elif shown_rect is highlight_rect:
+                pygame.display.update((self.title_rect, highlight_rect))
+            else:
+                pygame.display.update((self.title_rect, shown_rect, highlight_rect))
+            shown_rect = highlight_rect
         
         return None
     
@@ -240,35 +322,40 @@ class SpatialOSPro:
         start_time = time.time()
         running = True
         
+        # Nothing on this screen changes: compose it once
+        placeholder = pygame.Surface((self.width, self.height)).convert()
+        placeholder.fill(self.theme.BACKGROUND)
+        
+        # Title
+        title = self.font_large.render(realm_config['name'], True, realm_config['color'])
+        title_rect = title.get_rect(center=(self.width // 2, self.height // 2 - 50))
+        placeholder.blit(title, title_rect)
+        
+        # Message
+        msg = self.font_medium.render("Coming Soon - Under Development", True, self.theme.TEXT_SECONDARY)
+        msg_rect = msg.get_rect(center=(self.width // 2, self.height // 2 + 50))
+        placeholder.blit(msg, msg_rect)
+        
+        self.ui.draw_footer(placeholder, "ESC/Q: Return to Menu", realm_config['color'])
+        
+        self.screen.blit(placeholder, (0, 0))
+        pygame.display.flip()
+        
+        # Static screen: sleep until input arrives or the timeout is up
         while running:
-            elapsed = time.time() - start_time
+            remaining = 5 - (time.time() - start_time)
             
-            if elapsed > 5:  # Auto-exit after 5 seconds
+            if remaining <= 0:  # Auto-exit after 5 seconds
                 break
             
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT or \
-                   (event.type == pygame.KEYDOWN and event.key in [pygame.K_ESCAPE, pygame.K_q]):
-                    running = False
-            
-            self.screen.fill(self.theme.BACKGROUND)
-            
-            # Title
-            font_large = pygame.font.Font(None, int(self.height * 0.08))
-            title = font_large.render(realm_config['name'], True, realm_config['color'])
-            title_rect = title.get_rect(center=(self.width // 2, self.height // 2 - 50))
-            self.screen.blit(title, title_rect)
-            
-            # Message
-            font_medium = pygame.font.Font(None, int(self.height * 0.04))
-            msg = font_medium.render("Coming Soon - Under Development", True, self.theme.TEXT_SECONDARY)
-            msg_rect = msg.get_rect(center=(self.width // 2, self.height // 2 + 50))
-            self.screen.blit(msg, msg_rect)
-            
-            self.ui.draw_footer(self.screen, "ESC/Q: Return to Menu", realm_config['color'])
-            
-            pygame.display.flip()
-            self.clock.tick(60)
+            event = pygame.event.wait(int(remaining * 1000) + 1)
+            if event.type == pygame.QUIT or \
+               (event.type == pygame.KEYDOWN and event.key in EXIT_KEYS):
+                running = False
+            elif event.type in (pygame.WINDOWEXPOSED, pygame.VIDEOEXPOSE):
+                # The compositor lost the window contents: put them back
+                self.screen.blit(placeholder, (0, 0))
+                pygame.display.flip()
     
     def run(self) -> None:
         """Main application loop"""
@@ -280,6 +367,7 @@ class SpatialOSPro:
             
             self.launch_realm(realm_id)
         
+        clear_text_cache()
         pygame.quit()
         print("\n" + "="*70)
         print("  MotiBeam Spatial OS Pro - Shutdown Complete")
@@ -8,10 +8,28 @@ import pygame
 import sys
 import os
 from core.design_tokens import *
-from core.notification_banner import NotificationBanner
+from core.notification_banner import NotificationBanner, ms_to_next_minute
 from core.notification_ticker import NotificationTicker
+from core.text_cache import cached_render, get_font, clear as clear_text_cache
 from config.realms_config import REALMS
 
+# MOTIBEAM_DEBUG=1 echoes realm selections to stdout
+DEBUG = bool(os.getenv("MOTIBEAM_DEBUG"))
+
+# Posted by pygame.time.set_timer when the header clock needs a new minute
+MINUTE_EVENT = pygame.USEREVENT + 1
+
+# pygame-ce's single-call batched blit; vanilla pygame only has blits()
+_HAS_FBLITS = hasattr(pygame.Surface, "fblits")
+
+def _blit_batch(surface, blit_list):
+    """Submit (source, dest) pairs in one call: fblits on pygame-ce, else blits."""
+    if _HAS_FBLITS:
+        surface.fblits(blit_list)
+    else:
+        surface.blits(blit_list, doreturn=0)
+
+
 class SpatialOS:
     def __init__(self, width=1024, height=768, fullscreen=True):
         # Initialize pygame - try multiple video drivers for Pi compatibility
@@ -104,6 +122,20 @@ class SpatialOS:
         self.width = width
         self.height = height
         self.clock = pygame.time.Clock()
+
+        # handle_events only acts on QUIT, KEYDOWN, expose and minute
+        # events; let SDL discard mouse motion, other window and text-input
+        # events before they reach Python
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(
+            [pygame.QUIT, pygame.KEYDOWN, pygame.WINDOWEXPOSED, pygame.VIDEOEXPOSE,
+             MINUTE_EVENT]
+        )
+
+        # Card fonts, opened once; text goes through the shared cached_render
+        self.font_emoji = get_font(FONT_EMOJI_SIZE)
+        self.font_realm_title = get_font(FONT_REALM_TITLE_SIZE)
+        self.font_realm_subtitle = get_font(FONT_REALM_SUBTITLE_SIZE)
         self.running = True
 
         # Components
@@ -114,14 +146,61 @@ class SpatialOS:
         self.selected_realm = 0
         self.realms = REALMS
 
+        # Every arrow move resolved up front: (index, dx, dy) -> new index
+        realm_count = len(self.realms)
+        self.transitions = {}
+        for index in range(realm_count):
+            col = index % GRID_COLS
+            self.transitions[(index, -1, 0)] = index - 1 if col > 0 else index
+            self.transitions[(index, 1, 0)] = (
+                index + 1 if col < GRID_COLS - 1 and index < realm_count - 1 else index
+            )
+            self.transitions[(index, 0, -1)] = index - GRID_COLS if index >= GRID_COLS else index
+            self.transitions[(index, 0, 1)] = (
+                index + GRID_COLS if index + GRID_COLS < realm_count else index
+            )
+        self.nav_handlers = {
+            pygame.K_LEFT: (-1, 0),
+            pygame.K_RIGHT: (1, 0),
+            pygame.K_UP: (0, -1),
+            pygame.K_DOWN: (0, 1),
+        }
+        self.quick_select = {pygame.K_1 + i: i for i in range(min(9, realm_count))}
+        # Remaining keys map straight to their handler
+        self.key_actions = {
+            pygame.K_RETURN: self.select_realm,
+            pygame.K_a: self.trigger_weather_alert,
+            pygame.K_m: self.trigger_medical_alert,
+            pygame.K_c: self.clear_to_calm,
+            pygame.K_q: self.quit,
+        }
+
+        # Per-realm border colors never change - resolve them once
+        self.realm_border_colors = {
+            realm["id"]: REALM_COLORS.get(realm["id"], (100, 100, 110))
+            for realm in self.realms
+        }
+
+        # Card Rects keyed by (y_start, available_height); the grid only
+        # moves when an alert banner is shown or cleared
+        self._card_rects_cache = {}
+        # Grid area pre-drawn with every card unselected, keyed the same way
+        self._grid_bg_cache = {}
+        # Selected-state card sprites, keyed by (realm index, card size)
+        self._selected_card_cache = {}
+
         # Add sample ticker messages
         self.ticker.add_message("Weather: Sunny, 72°F • Traffic: Normal conditions on all routes")
         self.ticker.add_message("System Status: All realms operational • Last sync: 3 minutes ago")
         self.ticker.add_message("Calendar: Team meeting at 4:00 PM • No urgent tasks pending")
 
-        # Selection animation
-        self.selection_pulse = 0
-        self.selection_pulse_direction = 1
+        # Full redraw pending (set by state changes); otherwise only the
+        # ticker and any cards the selection moved between repaint
+        self._dirty = True
+        # Realm drawn as selected, and the (y_start, height) of the grid
+        # currently on screen
+        self._shown_realm = self.selected_realm
+        self._grid_key = None
 
     def handle_events(self):
         """Handle keyboard and window events."""
@@ -129,72 +208,82 @@ class SpatialOS:
             if event.type == pygame.QUIT:
                 self.running = False
 
-            elif event.type == pygame.KEYDOWN:
-                # Navigation
-                if event.key == pygame.K_LEFT:
-                    if self.selected_realm % GRID_COLS > 0:
-                        self.selected_realm -= 1
-
-                elif event.key == pygame.K_RIGHT:
-                    if self.selected_realm % GRID_COLS < GRID_COLS - 1 and self.selected_realm < len(self.realms) - 1:
-                        self.selected_realm += 1
+            # Window uncovered or output switched back: repaint everything
+            elif event.type in (pygame.WINDOWEXPOSED, pygame.VIDEOEXPOSE):
+                self._dirty = True
 
-                elif event.key == pygame.K_UP:
-                    if self.selected_realm >= GRID_COLS:
-                        self.selected_realm -= GRID_COLS
+            # Header clock rolled over: re-arm the one-shot timer and repaint
+            elif event.type == MINUTE_EVENT:
+                pygame.time.set_timer(MINUTE_EVENT, ms_to_next_minute(), 1)
+                self._dirty = True
 
-                elif event.key == pygame.K_DOWN:
-                    if self.selected_realm + GRID_COLS < len(self.realms):
-                        self.selected_realm += GRID_COLS
-
-                # Enter to select
-                elif event.key == pygame.K_RETURN:
-                    realm = self.realms[self.selected_realm]
-                    print(f"Selected realm: {realm['name']}")
-                    self.ticker.add_message(f"Entering {realm['name']} - {realm['tagline']}")
+            elif event.type == pygame.KEYDOWN:
+                # Navigation
+                move = self.nav_handlers.get(event.key)
+                if move is not None:
+                    dx, dy = move
+                    self.selected_realm = self.transitions[(self.selected_realm, dx, dy)]
 
                 # Quick select with numbers
-                elif event.key >= pygame.K_1 and event.key <= pygame.K_9:
-                    realm_num = event.key - pygame.K_1
-                    if realm_num < len(self.realms):
-                        self.selected_realm = realm_num
-
-                # State changes
-                elif event.key == pygame.K_a:
-                    # Trigger severe weather alert
-                    self.banner.clear_alerts()
-                    self.banner.add_alert("severe", "⚠ SEVERE WEATHER WARNING", "Tornado spotted nearby. Take shelter immediately.")
-                    self.banner.set_state("ALERT")
-                    self.ticker.add_message("ALERT: Severe weather detected in your area")
-
-                elif event.key == pygame.K_m:
-                    # Trigger medical alert
-                    self.banner.clear_alerts()
-                    self.banner.add_alert("medical", "🏥 MEDICAL REMINDER", "Time to take medication - check MediBeam")
-                    self.banner.set_state("ALERT")
-                    self.ticker.add_message("Medical reminder active")
-
-                elif event.key == pygame.K_c:
-                    # Clear alerts, return to calm
-                    self.banner.clear_alerts()
-                    self.banner.set_state("CALM")
-                    self.ticker.add_message("System returned to calm state")
-
-                # Quit
-                elif event.key == pygame.K_q:
-                    self.running = False
+                elif event.key in self.quick_select:
+                    self.selected_realm = self.quick_select[event.key]
+
+                # Enter, alert triggers and quit
+                else:
+                    action = self.key_actions.get(event.key)
+                    if action is not None:
+                        action()
+
+    def select_realm(self):
+        """Announce the selected realm on the ticker."""
+        self._dirty = True
+        realm = self.realms[self.selected_realm]
+        if DEBUG:
+            print(f"Selected realm: {realm['name']}")
+        self.ticker.add_message(f"Entering {realm['name']} - {realm['tagline']}")
+
+    def trigger_weather_alert(self):
+        """Trigger severe weather alert."""
+        self._dirty = True
+        self.banner.clear_alerts()
+        self.banner.add_alert("severe", "⚠ SEVERE WEATHER WARNING", "Tornado spotted nearby. Take shelter immediately.")
+        self.banner.set_state("ALERT")
+        self.ticker.add_message("ALERT: Severe weather detected in your area")
+
+    def trigger_medical_alert(self):
+        """Trigger medical alert."""
+        self._dirty = True
+        self.banner.clear_alerts()
+        self.banner.add_alert("medical", "🏥 MEDICAL REMINDER", "Time to take medication - check MediBeam")
+        self.banner.set_state("ALERT")
+        self.ticker.add_message("Medical reminder active")
+
+    def clear_to_calm(self):
+        """Clear alerts, return to calm."""
+        self._dirty = True
+        self.banner.clear_alerts()
+        self.banner.set_state("CALM")
+        self.ticker.add_message("System returned to calm state")
+
+    def quit(self):
+        """Stop the main loop."""
+        self.running = False
 
     def update(self):
         """Update animations and state."""
         self.ticker.update()
 
-        # Update selection pulse animation (subtle)
-        self.selection_pulse += 0.02 * self.selection_pulse_direction
-        if self.selection_pulse >= 1.0 or self.selection_pulse <= 0.0:
-            self.selection_pulse_direction *= -1
-
     def draw(self):
-        """Render the complete UI."""
+        """Render the UI; the header and grid only repaint when something changed."""
+        if not self._dirty and self._grid_key:
+            dirty_rects = [self.ticker.rect]
+            if self.selected_realm != self._shown_realm:
+                dirty_rects.extend(self.redraw_selection())
+            self.ticker.draw(self.screen)
+            pygame.display.update(dirty_rects)
+            return
+        self._dirty = False
+
         # Background
         self.screen.fill(BG_COLOR)
 
@@ -211,78 +300,133 @@ class SpatialOS:
 
         pygame.display.flip()
 
+    def get_card_rects(self, y_start, available_height):
+        """Return the cached card Rects for a grid starting at y_start."""
+        key = (y_start, available_height)
+        rects = self._card_rects_cache.get(key)
+        if rects is None:
+            # Calculate card dimensions
+            grid_width = self.width - PADDING * 2
+            card_width = (grid_width - (GRID_COLS - 1) * CARD_SPACING) // GRID_COLS
+            card_height = (available_height - (GRID_ROWS - 1) * CARD_SPACING) // GRID_ROWS
+
+            rects = []
+            for idx in range(len(self.realms)):
+                row, col = divmod(idx, GRID_COLS)
+
+                # Card position
+                x = PADDING + col * (card_width + CARD_SPACING)
+                y = y_start + row * (card_height + CARD_SPACING)
+                rects.append(pygame.Rect(x, y, card_width, card_height))
+
+            self._card_rects_cache[key] = rects
+        return rects
+
+    def get_grid_bg(self, y_start, available_height):
+        """Return the grid area pre-drawn with every card unselected."""
+        key = (y_start, available_height)
+        grid_bg = self._grid_bg_cache.get(key)
+        if grid_bg is None:
+            grid_bg = pygame.Surface((self.width, available_height)).convert()
+            grid_bg.fill(BG_COLOR)
+            rects = self.get_card_rects(y_start, available_height)
+            for realm, card_rect in zip(self.realms, rects):
+                self.draw_realm_card(grid_bg, realm, card_rect.move(0, -y_start), False)
+            self._grid_bg_cache[key] = grid_bg
+        return grid_bg
+
     def draw_realm_grid(self, y_start, available_height):
         """Draw the 4x3 grid of realm cards with emojis."""
-        # Calculate card dimensions
-        grid_width = self.width - PADDING * 2
-        card_width = (grid_width - (GRID_COLS - 1) * CARD_SPACING) // GRID_COLS
-        card_height = (available_height - (GRID_ROWS - 1) * CARD_SPACING) // GRID_ROWS
-
-        for idx, realm in enumerate(self.realms):
-            row = idx // GRID_COLS
-            col = idx % GRID_COLS
-
-            # Card position
-            x = PADDING + col * (card_width + CARD_SPACING)
-            y = y_start + row * (card_height + CARD_SPACING)
-
-            self.draw_realm_card(realm, x, y, card_width, card_height, idx == self.selected_realm)
-
-    def draw_realm_card(self, realm, x, y, width, height, is_selected):
+        # Unselected cards come pre-drawn; only the selected one is drawn live
+        self.screen.blit(self.get_grid_bg(y_start, available_height), (0, y_start))
+        self._grid_key = (y_start, available_height)
+
+        idx = self.selected_realm
+        card_rect = self.get_card_rects(y_start, available_height)[idx]
+        self.screen.blit(self.get_selected_card(idx, card_rect.size), card_rect)
+        self._shown_realm = idx
+
+    def redraw_selection(self):
+        """Move the selection on screen; return the two card Rects touched."""
+        y_start, available_height = self._grid_key
+        rects = self.get_card_rects(y_start, available_height)
+
+        # Restore the previously selected card from the unselected grid
+        old_rect = rects[self._shown_realm]
+        grid_bg = self.get_grid_bg(y_start, available_height)
+        self.screen.blit(grid_bg, old_rect, old_rect.move(0, -y_start))
+
+        idx = self.selected_realm
+        new_rect = rects[idx]
+        self.screen.blit(self.get_selected_card(idx, new_rect.size), new_rect)
+        self._shown_realm = idx
+        return old_rect, new_rect
+
+    def get_selected_card(self, idx, size):
+        """Return realm idx's card pre-drawn in its selected state."""
+        key = (idx, size)
+        card = self._selected_card_cache.get(key)
+        if card is None:
+            # Opaque sprite: the rounded corners show the grid background
+            card = pygame.Surface(size).convert()
+            card.fill(BG_COLOR)
+            self.draw_realm_card(card, self.realms[idx], card.get_rect(), True)
+            self._selected_card_cache[key] = card
+        return card
+
+    def draw_realm_card(self, surface, realm, card_rect, is_selected):
         """Draw a single realm card with emoji, title, and tagline."""
+        x, y, width, height = card_rect
+
         # Card background
-        card_rect = pygame.Rect(x, y, width, height)
-        pygame.draw.rect(self.screen, BG_HEADER, card_rect, border_radius=CARD_RADIUS)
+        pygame.draw.rect(surface, BG_HEADER, card_rect, border_radius=CARD_RADIUS)
 
         # Border color
-        border_color = REALM_COLORS.get(realm["id"], (100, 100, 110))
+        border_color = self.realm_border_colors[realm["id"]]
 
-        # Selection highlight with pulse
+        # Selection highlight
         if is_selected:
             border_width = SELECTION_WIDTH
-            # Pulse effect - vary opacity slightly
-            pulse_alpha = int(200 + 55 * self.selection_pulse)
-            selection_color = (*SELECTION_COLOR, pulse_alpha)
 
             # Draw thicker yellow border with subtle glow
-            pygame.draw.rect(self.screen, SELECTION_COLOR, card_rect,
+            pygame.draw.rect(surface, SELECTION_COLOR, card_rect,
                            width=border_width, border_radius=CARD_RADIUS)
 
             # Inner subtle glow
             glow_rect = pygame.Rect(x + 2, y + 2, width - 4, height - 4)
-            pygame.draw.rect(self.screen, SELECTION_COLOR, glow_rect,
+            pygame.draw.rect(surface, SELECTION_COLOR, glow_rect,
                            width=1, border_radius=CARD_RADIUS)
         else:
-            pygame.draw.rect(self.screen, border_color, card_rect,
+            pygame.draw.rect(surface, border_color, card_rect,
                            width=2, border_radius=CARD_RADIUS)
 
-        # Content positioning
+        # Content positioning; text blits are collected and submitted at once
         content_y = y + CARD_PADDING
+        blit_list = []
 
         # Emoji (large and centered)
         emoji = realm.get("emoji", "")
         if emoji:
             try:
-                font_emoji = pygame.font.Font(None, FONT_EMOJI_SIZE)
-                emoji_surface = font_emoji.render(emoji, True, TEXT_PRIMARY)
+                emoji_surface = cached_render(self.font_emoji, emoji, TEXT_PRIMARY)
                 emoji_x = x + (width - emoji_surface.get_width()) // 2
-                self.screen.blit(emoji_surface, (emoji_x, content_y))
+                blit_list.append((emoji_surface, (emoji_x, content_y)))
                 content_y += emoji_surface.get_height() + CARD_PADDING
             except Exception as e:
                 print(f"Error rendering emoji for {realm['name']}: {e}")
 
         # Realm name (bold, large)
-        font_title = pygame.font.Font(None, FONT_REALM_TITLE_SIZE)
-        title_surface = font_title.render(realm["name"], True, TEXT_PRIMARY)
+        title_surface = cached_render(self.font_realm_title, realm["name"], TEXT_PRIMARY)
         title_x = x + (width - title_surface.get_width()) // 2
-        self.screen.blit(title_surface, (title_x, content_y))
+        blit_list.append((title_surface, (title_x, content_y)))
         content_y += title_surface.get_height() + 8
 
         # Tagline (smaller, muted)
-        font_subtitle = pygame.font.Font(None, FONT_REALM_SUBTITLE_SIZE)
-        subtitle_surface = font_subtitle.render(realm["tagline"], True, TEXT_SECONDARY)
+        subtitle_surface = cached_render(self.font_realm_subtitle, realm["tagline"], TEXT_SECONDARY)
         subtitle_x = x + (width - subtitle_surface.get_width()) // 2
-        self.screen.blit(subtitle_surface, (subtitle_x, content_y))
+        blit_list.append((subtitle_surface, (subtitle_x, content_y)))
+
+        _blit_batch(surface, blit_list)
 
     def run(self):
         """Main game loop."""
@@ -304,6 +448,9 @@ class SpatialOS:
         print("UI should now be visible on the projector!")
         print()
 
+        # One-shot timer, re-armed on every tick so it stays on the minute
+        pygame.time.set_timer(MINUTE_EVENT, ms_to_next_minute(), 1)
+
         while self.running:
             try:
                 self.handle_events()
@@ -319,6 +466,7 @@ class SpatialOS:
                 traceback.print_exc()
                 self.running = False
 
+        clear_text_cache()
         pygame.quit()
         print("MotiBeam Spatial OS - Shutdown complete.")
 
@@ -0,0 +1,48 @@
+"""
+MotiBeam Spatial OS - Tests
+Run headless: SDL's dummy video/audio drivers stand in for the projector.
+
+    python -m unittest discover -s tests -t .
+"""
+
+import os
+import unittest
+from unittest import mock
+
+import pygame
+
+from core import text_cache
+
+HEADLESS_ENV = {"SDL_VIDEODRIVER": "dummy", "SDL_AUDIODRIVER": "dummy"}
+
+# Arrow moves as (dx, dy), the keys of the shells' transition tables
+MOVES = ((-1, 0), (1, 0), (0, -1), (0, 1))
+
+
+def expected_move(index, dx, dy, count, cols):
+    """Where (dx, dy) from index lands on a cols-wide grid of count cards."""
+    row, col = divmod(index, cols)
+    rows = (count + cols - 1) // cols
+    new_row = row + dy
+    new_col = col + dx
+    if not (0 <= new_row < rows and 0 <= new_col < cols):
+        return index
+    new_index = new_row * cols + new_col
+    return new_index if new_index < count else index
+
+
+class HeadlessTestCase(unittest.TestCase):
+    """Gives every test a fresh pygame session on the dummy drivers.
+
+    SpatialOS rewrites SDL_VIDEODRIVER while probing for a driver, so the
+    environment is restored after each test as well as pygame itself.
+    """
+
+    def setUp(self):
+        env = mock.patch.dict(os.environ, HEADLESS_ENV)
+        env.start()
+        self.addCleanup(env.stop)
+
+    def tearDown(self):
+        text_cache.clear()
+        pygame.quit()
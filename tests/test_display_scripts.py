@@ -0,0 +1,43 @@
+"""Headless runs of the display-check scripts (launcher, spatial_min)."""
+
+import unittest
+from unittest import mock
+
+import pygame
+
+import motibeam_launcher
+import spatial_min
+from tests import HeadlessTestCase
+
+
+def key_event(key):
+    return pygame.event.Event(pygame.KEYDOWN, key=key, mod=0, unicode="", scancode=0)
+
+
+class DisplayScriptTest(HeadlessTestCase):
+    def setUp(self):
+        super().setUp()
+        flip = mock.patch("pygame.display.flip", wraps=pygame.display.flip)
+        self.flip = flip.start()
+        self.addCleanup(flip.stop)
+
+    def wait_events(self, *keys):
+        events = [pygame.event.Event(pygame.WINDOWEXPOSED)]
+        events += [key_event(key) for key in keys]
+        return mock.patch("pygame.event.wait", side_effect=events)
+
+    def test_launcher_reflips_on_expose(self):
+        with self.wait_events(pygame.K_RETURN, pygame.K_q):
+            with self.assertRaises(SystemExit):
+                motibeam_launcher.main()
+        # The first frame, then one more for the expose
+        self.assertEqual(self.flip.call_count, 2)
+
+    def test_spatial_min_reflips_on_expose(self):
+        with self.wait_events(pygame.K_RETURN, pygame.K_q):
+            spatial_min.main()
+        self.assertEqual(self.flip.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,105 @@
+"""Headless tests for the MotiBeamOS launcher (spatial_os.py)."""
+
+import os
+import unittest
+from unittest import mock
+
+import pygame
+
+import spatial_os
+from tests import MOVES, HeadlessTestCase, expected_move
+
+
+class MotiBeamOSTestCase(HeadlessTestCase):
+    def setUp(self):
+        super().setUp()
+        self.app = spatial_os.MotiBeamOS()
+        self.app.render()
+
+    def press(self, key):
+        self.app.handle_key(key)
+        self.app.render()
+
+
+class DirtyRectTest(MotiBeamOSTestCase):
+    def test_partial_repaint_matches_full_repaint(self):
+        for key in (pygame.K_RIGHT, pygame.K_DOWN, pygame.K_LEFT):
+            self.press(key)
+        partial = pygame.image.tobytes(self.app.screen, "RGB")
+        self.app._dirty = True
+        self.app.render()
+        self.assertEqual(partial, pygame.image.tobytes(self.app.screen, "RGB"))
+
+
+class KeyDispatchTest(MotiBeamOSTestCase):
+    def test_arrow_keys_move_selection(self):
+        self.press(pygame.K_RIGHT)
+        self.assertEqual(self.app.selected_index, 1)
+        self.press(pygame.K_DOWN)
+        self.assertEqual(self.app.selected_index, 1 + spatial_os.GRID_COLS)
+        self.press(pygame.K_LEFT)
+        self.press(pygame.K_UP)
+        self.assertEqual(self.app.selected_index, 0)
+        self.assertEqual(self.app._shown_index, 0)
+
+    def test_number_keys_jump_to_card(self):
+        self.press(pygame.K_5)
+        self.assertEqual(self.app.selected_index, 4)
+
+    def test_enter_keeps_selection(self):
+        self.press(pygame.K_3)
+        self.press(pygame.K_RETURN)
+        self.assertEqual(self.app.selected_index, 2)
+
+    def test_quit_key_exits(self):
+        with self.assertRaises(SystemExit):
+            self.app.handle_key(pygame.K_q)
+
+
+class ExposeTest(MotiBeamOSTestCase):
+    def test_expose_repaints_the_whole_screen(self):
+        frame = pygame.image.tobytes(self.app.screen, "RGB")
+        self.app.screen.fill((0, 0, 0))
+        flipped = []
+
+        def flip():
+            flipped.append(pygame.image.tobytes(self.app.screen, "RGB"))
+
+        events = [
+            pygame.event.Event(pygame.WINDOWEXPOSED),
+            pygame.event.Event(pygame.KEYDOWN, key=pygame.K_q),
+        ]
+        with mock.patch("pygame.event.wait", side_effect=events), \
+                mock.patch("pygame.event.get", return_value=[]), \
+                mock.patch("pygame.display.flip", side_effect=flip):
+            with self.assertRaises(SystemExit):
+                self.app.run()
+        # Compare by hand: difflib over two screenfuls of bytes never ends
+        self.assertEqual(len(flipped), 1)
+        self.assertTrue(flipped[0] == frame, "expose left the screen wiped")
+
+
+class DisplayHintTest(HeadlessTestCase):
+    def test_exported_sdl_hints_are_kept(self):
+        os.environ["SDL_VIDEO_DOUBLE_BUFFER"] = "0"
+        os.environ["SDL_VIDEO_ALLOW_SCREENSAVER"] = "1"
+        spatial_os.MotiBeamOS()
+        self.assertEqual(os.environ["SDL_VIDEO_DOUBLE_BUFFER"], "0")
+        self.assertEqual(os.environ["SDL_VIDEO_ALLOW_SCREENSAVER"], "1")
+
+
+class TransitionTableTest(MotiBeamOSTestCase):
+    def test_table_matches_grid_model(self):
+        count = len(spatial_os.REALMS)
+        self.assertEqual(len(self.app.transitions), count * len(MOVES))
+        for index in range(count):
+            for dx, dy in MOVES:
+                self.assertEqual(
+                    self.app.transitions[(index, dx, dy)],
+                    expected_move(index, dx, dy, count, spatial_os.GRID_COLS),
+                    f"move {(dx, dy)} from card {index}",
+                )
+
+
+if __name__ == "__main__":
+    unittest.main()
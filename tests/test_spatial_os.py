@@ -0,0 +1,97 @@
+"""Headless tests for the SpatialOS shell (spatial_os_pygame.py)."""
+
+import unittest
+from unittest import mock
+
+import pygame
+
+import spatial_os_pygame
+from tests import MOVES, HeadlessTestCase, expected_move
+
+
+def key_event(key):
+    return pygame.event.Event(pygame.KEYDOWN, key=key, mod=0, unicode="", scancode=0)
+
+
+class SpatialOSTestCase(HeadlessTestCase):
+    def setUp(self):
+        super().setUp()
+        self.app = spatial_os_pygame.SpatialOS(fullscreen=False)
+        self.app.draw()
+
+    def press(self, *keys):
+        for key in keys:
+            pygame.event.post(key_event(key))
+        self.app.handle_events()
+        self.app.update()
+        self.app.draw()
+
+
+class DirtyRectTest(SpatialOSTestCase):
+    def test_partial_repaint_matches_full_repaint(self):
+        self.press(pygame.K_RIGHT, pygame.K_DOWN)
+        partial = pygame.image.tobytes(self.app.screen, "RGB")
+        self.app._dirty = True
+        self.app.draw()
+        self.assertEqual(partial, pygame.image.tobytes(self.app.screen, "RGB"))
+
+
+class KeyDispatchTest(SpatialOSTestCase):
+    def test_arrow_keys_move_selection(self):
+        self.press(pygame.K_RIGHT, pygame.K_DOWN)
+        self.assertEqual(self.app.selected_realm, 1 + spatial_os_pygame.GRID_COLS)
+        self.assertEqual(self.app._shown_realm, self.app.selected_realm)
+
+    def test_number_keys_jump_to_card(self):
+        self.press(pygame.K_7)
+        self.assertEqual(self.app.selected_realm, 6)
+
+    def test_enter_and_alert_keys(self):
+        self.press(pygame.K_RETURN, pygame.K_a)
+        self.assertEqual(self.app.banner.current_state, "ALERT")
+        self.press(pygame.K_RIGHT, pygame.K_c)
+        self.assertEqual(self.app.banner.current_state, "CALM")
+        self.assertEqual(self.app.selected_realm, 1)
+
+    def test_quit_key_stops_the_loop(self):
+        self.press(pygame.K_q)
+        self.assertFalse(self.app.running)
+
+
+class ExposeTest(SpatialOSTestCase):
+    def test_expose_restores_a_wiped_screen(self):
+        frame = pygame.image.tobytes(self.app.screen, "RGB")
+        self.app.screen.fill((0, 0, 0))
+        pygame.event.post(pygame.event.Event(pygame.WINDOWEXPOSED))
+        self.app.handle_events()
+        self.assertTrue(self.app._dirty)
+        self.app.draw()
+        self.assertEqual(frame, pygame.image.tobytes(self.app.screen, "RGB"))
+
+
+class MinuteTimerTest(SpatialOSTestCase):
+    def test_minute_event_repaints_and_rearms(self):
+        pygame.event.post(pygame.event.Event(spatial_os_pygame.MINUTE_EVENT))
+        with mock.patch("pygame.time.set_timer") as set_timer:
+            self.app.handle_events()
+        self.assertTrue(self.app._dirty)
+        set_timer.assert_called_once_with(
+            spatial_os_pygame.MINUTE_EVENT, mock.ANY, 1
+        )
+
+
+class TransitionTableTest(SpatialOSTestCase):
+    def test_table_matches_grid_model(self):
+        count = len(self.app.realms)
+        self.assertEqual(len(self.app.transitions), count * len(MOVES))
+        for index in range(count):
+            for dx, dy in MOVES:
+                self.assertEqual(
+                    self.app.transitions[(index, dx, dy)],
+                    expected_move(index, dx, dy, count, spatial_os_pygame.GRID_COLS),
+                    f"move {(dx, dy)} from card {index}",
+                )
+
+
+if __name__ == "__main__":
+    unittest.main()
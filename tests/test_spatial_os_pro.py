@@ -0,0 +1,111 @@
+"""Headless tests for the SpatialOSPro menu (spatial_os_pro.py)."""
+
+import unittest
+from unittest import mock
+
+import pygame
+
+from tests import HeadlessTestCase, ui_framework_stub
+
+ui_framework_stub.install()
+import spatial_os_pro  # noqa: E402
+
+
+def key_event(key):
+    return pygame.event.Event(pygame.KEYDOWN, key=key, mod=0, unicode="", scancode=0)
+
+
+class StopMenu(Exception):
+    pass
+
+
+class SpatialOSProTestCase(HeadlessTestCase):
+    def setUp(self):
+        super().setUp()
+        self.app = spatial_os_pro.SpatialOSPro()
+
+    def post_keys(self, *keys):
+        for key in keys:
+            pygame.event.post(key_event(key))
+
+
+class MenuKeyTest(SpatialOSProTestCase):
+    def test_arrows_then_enter_select_realm(self):
+        self.post_keys(pygame.K_DOWN, pygame.K_DOWN, pygame.K_UP, pygame.K_RETURN)
+        self.assertEqual(self.app.show_menu(), self.app.realm_order[1])
+
+    def test_number_key_selects_realm(self):
+        self.post_keys(pygame.K_3)
+        self.assertEqual(self.app.show_menu(), self.app.realm_order[2])
+
+    def test_exit_key_leaves_menu(self):
+        self.post_keys(pygame.K_ESCAPE)
+        self.assertIsNone(self.app.show_menu())
+
+
+class MenuRepaintTest(SpatialOSProTestCase):
+    def run_menu(self, *between_frames):
+        """Run show_menu, calling between_frames[i] once frame i is shown.
+
+        Returns (presenter, pixels) for every frame, one more than the
+        number of callbacks.
+        """
+        frames = []
+
+        def presenter(name):
+            def present(*args):
+                frames.append((name, pygame.image.tobytes(self.app.screen, "RGB")))
+                if len(frames) > len(between_frames):
+                    raise StopMenu
+                between_frames[len(frames) - 1]()
+            return present
+
+        with mock.patch("pygame.display.flip", side_effect=presenter("flip")), \
+                mock.patch("pygame.display.update", side_effect=presenter("update")):
+            with self.assertRaises(StopMenu):
+                self.app.show_menu()
+        return frames
+
+    def post_expose(self, event_type=pygame.WINDOWEXPOSED):
+        pygame.event.post(pygame.event.Event(event_type))
+
+    def test_partial_repaint_matches_full_repaint(self):
+        frames = self.run_menu(lambda: self.post_keys(pygame.K_DOWN), self.post_expose)
+        self.assertEqual([name for name, _ in frames], ["flip", "update", "flip"])
+        self.assertTrue(frames[1][1] == frames[2][1], "partial repaint differs")
+
+    def test_expose_repaints_a_wiped_screen(self):
+        def wipe_and_expose():
+            self.app.screen.fill((0, 0, 0))
+            self.post_expose(pygame.VIDEOEXPOSE)
+
+        frames = self.run_menu(wipe_and_expose)
+        self.assertEqual(frames[1][0], "flip")
+        self.assertTrue(frames[1][1] == frames[0][1], "expose left the screen wiped")
+
+
+class PlaceholderTest(SpatialOSProTestCase):
+    def test_expose_repaints_the_placeholder(self):
+        flipped = []
+
+        def flip():
+            flipped.append(pygame.image.tobytes(self.app.screen, "RGB"))
+
+        events = iter((
+            pygame.event.Event(pygame.WINDOWEXPOSED),
+            key_event(pygame.K_ESCAPE),
+        ))
+
+        def wait(timeout):
+            self.app.screen.fill((0, 0, 0))
+            return next(events)
+
+        with mock.patch("pygame.display.flip", side_effect=flip), \
+                mock.patch("pygame.event.wait", side_effect=wait):
+            self.app.show_placeholder(self.app.realms['home'])
+        self.assertEqual(len(flipped), 2)
+        self.assertTrue(flipped[1] == flipped[0], "expose left the screen wiped")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,54 @@
+"""Cache behaviour of core.text_cache."""
+
+import unittest
+
+import pygame
+
+from core import text_cache
+from tests import HeadlessTestCase
+
+
+class TextCacheTest(HeadlessTestCase):
+    def setUp(self):
+        super().setUp()
+        pygame.display.init()
+        pygame.font.init()
+        # cached_render converts to the display format, so it needs a mode
+        pygame.display.set_mode((64, 64))
+        text_cache.clear()
+
+    def test_get_font_is_shared_per_size(self):
+        self.assertIs(text_cache.get_font(24), text_cache.get_font(24))
+        self.assertIsNot(text_cache.get_font(24), text_cache.get_font(30))
+
+    def test_cached_render_hits(self):
+        font = text_cache.get_font(24)
+        first = text_cache.cached_render(font, "MOTIBEAM", (255, 255, 255))
+        second = text_cache.cached_render(font, "MOTIBEAM", (255, 255, 255))
+        self.assertIs(first, second)
+        info = text_cache.cached_render.cache_info()
+        self.assertEqual((info.hits, info.misses), (1, 1))
+
+    def test_cached_render_keys_on_color(self):
+        font = text_cache.get_font(24)
+        white = text_cache.cached_render(font, "MOTIBEAM", (255, 255, 255))
+        grey = text_cache.cached_render(font, "MOTIBEAM", (128, 128, 128))
+        self.assertIsNot(white, grey)
+
+    def test_cached_render_matches_display_format(self):
+        font = text_cache.get_font(24)
+        surf = text_cache.cached_render(font, "MOTIBEAM", (255, 255, 255))
+        self.assertTrue(surf.get_flags() & pygame.SRCALPHA)
+        self.assertEqual(surf.get_bitsize(), 32)
+
+    def test_clear_empties_both_caches(self):
+        font = text_cache.get_font(24)
+        text_cache.cached_render(font, "MOTIBEAM", (255, 255, 255))
+        text_cache.clear()
+        self.assertEqual(text_cache.get_font.cache_info().currsize, 0)
+        self.assertEqual(text_cache.cached_render.cache_info().currsize, 0)
+        self.assertIsNot(text_cache.get_font(24), font)
+
+
+if __name__ == "__main__":
+    unittest.main()
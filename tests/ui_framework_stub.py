@@ -0,0 +1,56 @@
+"""
+Minimal stand-in for core.ui.framework, which ships with the projector
+image rather than this repo. Only what SpatialOSPro touches is provided.
+"""
+
+import sys
+import types
+
+import pygame
+
+
+class Theme:
+    BACKGROUND = (5, 8, 15)
+    PRIMARY = (0, 200, 255)
+    TEXT_PRIMARY = (250, 250, 250)
+    TEXT_SECONDARY = (160, 160, 170)
+    TEXT_DIM = (90, 90, 100)
+    INFO = (80, 160, 255)
+    WARNING = (255, 180, 0)
+    REALM_COLORS = {
+        realm: (30 * i, 100 + 10 * i, 200 - 15 * i)
+        for i, realm in enumerate((
+            'home', 'clinical', 'education', 'transport', 'emergency',
+            'security', 'enterprise', 'aviation', 'maritime',
+        ))
+    }
+
+
+class UIComponents:
+    def pulse_value(self, t, frequency, low, high):
+        return (low + high) / 2
+
+    def draw_footer(self, screen, text, color):
+        width, height = screen.get_size()
+        pygame.draw.rect(screen, color, (0, height - 40, width, 40))
+
+
+class Animations:
+    pass
+
+
+def install():
+    """Register the stub as core.ui.framework unless the real one imports."""
+    try:
+        import core.ui.framework  # noqa: F401
+        return
+    except ImportError:
+        pass
+    package = types.ModuleType("core.ui")
+    framework = types.ModuleType("core.ui.framework")
+    framework.Theme = Theme
+    framework.UIComponents = UIComponents
+    framework.Animations = Animations
+    package.framework = framework
+    sys.modules["core.ui"] = package
+    sys.modules["core.ui.framework"] = framework